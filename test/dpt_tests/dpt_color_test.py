@@ -1,7 +1,7 @@
 """Unit test for KNX color objects."""
 import pytest
 
-from xknx.dpt.dpt_color import DPTArray, DPTColorXYY, XYYColor
+from xknx.dpt.dpt_color import DPTArray, DPTBinary, DPTColorXYY, XYYColor
 from xknx.exceptions import ConversionError, CouldNotParseTelegram
 
 
@@ -99,3 +99,35 @@ class TestDPTColorXYY:
         """Test DPTColorXYY parsing with wrong value."""
         with pytest.raises(CouldNotParseTelegram):
             DPTColorXYY.from_knx(DPTArray((0xFF, 0x4E, 0x12)))
+        with pytest.raises(CouldNotParseTelegram):
+            DPTColorXYY.from_knx(DPTBinary(0x01))
+
+    def test_xyycolor_no_instance_dict(self):
+        """Test XYYColor instances don't allocate a `__dict__`."""
+        assert not hasattr(XYYColor(color=(0.2, 0.2), brightness=128), "__dict__")
+
+    def test_xyycolor_bulk(self):
+        """Test DPTColorXYY bulk parsing and streaming."""
+        raw = bytes(
+            (
+                *(0x33, 0x33, 0x33, 0x33, 0x80, 0x03),
+                *(0x00, 0x00, 0x00, 0x00, 0x00, 0x01),
+                *(0xCC, 0xCC, 0xCC, 0xCC, 0x00, 0x02),
+            )
+        )
+        values = [
+            XYYColor(color=(0.2, 0.2), brightness=128),
+            XYYColor(color=None, brightness=0),
+            XYYColor(color=(0.8, 0.8), brightness=None),
+        ]
+        assert DPTColorXYY.from_knx_bulk(raw) == values
+        assert DPTColorXYY.to_knx_bulk(values) == raw
+        assert DPTColorXYY.from_knx_bulk(b"") == []
+        assert DPTColorXYY.to_knx_bulk([]) == b""
+
+    def test_xyycolor_bulk_wrong_value(self):
+        """Test DPTColorXYY bulk parsing and streaming with wrong value."""
+        with pytest.raises(CouldNotParseTelegram):
+            DPTColorXYY.from_knx_bulk(bytes((0xFF, 0x4E, 0x12, 0x00, 0x00, 0x03, 0x00)))
+        with pytest.raises(ConversionError):
+            DPTColorXYY.to_knx_bulk([((0.2, 0.2), 128), ((1.1, 0), 0)])
@@ -1,4 +1,6 @@
 """Unit test for RemoteValueColorXYY objects."""
+from unittest.mock import AsyncMock
+
 import pytest
 
 from xknx import XKNX
@@ -78,6 +80,26 @@ class TestRemoteValueColorXYY:
         await remote_value.process(telegram)
         assert remote_value.value == ((1, 0.4), 250)
 
+    async def test_process_unchanged_value(self):
+        """Test processing an unchanged value doesn't call after_update_cb."""
+        xknx = XKNX()
+        after_update_cb = AsyncMock()
+        remote_value = RemoteValueColorXYY(
+            xknx,
+            group_address=GroupAddress("1/2/3"),
+            after_update_cb=after_update_cb,
+        )
+        telegram = Telegram(
+            destination_address=GroupAddress("1/2/3"),
+            payload=GroupValueWrite(DPTArray((0xFF, 0xFF, 0x66, 0x66, 0xFA, 0x03))),
+        )
+        await remote_value.process(telegram)
+        after_update_cb.assert_called_once_with()
+        after_update_cb.reset_mock()
+
+        await remote_value.process(telegram)
+        after_update_cb.assert_not_called()
+
     async def test_to_process_error(self):
         """Test process erroneous telegram."""
         xknx = XKNX()
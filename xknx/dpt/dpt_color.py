@@ -1,13 +1,26 @@
 """Implementation of the KNX date data point."""
 from __future__ import annotations
 
+from collections.abc import Sequence
+import struct
 from typing import NamedTuple
 
-from xknx.exceptions import ConversionError
+from xknx.exceptions import ConversionError, CouldNotParseTelegram
 
 from .dpt import DPTBase
 from .payload import DPTArray, DPTBinary
 
+# x-axis, y-axis, brightness, validity bits
+_XYY_STRUCT = struct.Struct(">HHBB")
+_INV_FFFF: float = 1.0 / 0xFFFF
+# (color_valid, brightness_valid) indexed by the 2 validity bits of the last octet
+_VALID_FLAGS: tuple[tuple[bool, bool], ...] = (
+    (False, False),
+    (False, True),
+    (True, False),
+    (True, True),
+)
+
 
 class XYYColor(NamedTuple):
     """
@@ -31,20 +44,22 @@ class DPTColorXYY(DPTBase):
     @classmethod
     def from_knx(cls, payload: DPTArray | DPTBinary) -> XYYColor:
         """Parse/deserialize from KNX/IP raw data."""
-        raw = cls.validate_payload(payload)
-
-        x_axis_int = raw[0] << 8 | raw[1]
-        y_axis_int = raw[2] << 8 | raw[3]
-        brightness = raw[4]
+        # fast path for valid payloads; exact type check skips the MRO walk of isinstance
+        raw = (
+            payload.value
+            if type(payload) is DPTArray  # pylint: disable=unidiomatic-typecheck
+            and len(payload.value) == cls.payload_length
+            else cls.validate_payload(payload)
+        )
 
-        color_valid = raw[5] >> 1 & 0b1
-        brightness_valid = raw[5] & 0b1
+        x_axis_int, y_axis_int, brightness, flags = _XYY_STRUCT.unpack_from(bytes(raw))
+        color_valid, brightness_valid = _VALID_FLAGS[flags & 0b11]
 
         return XYYColor(
             color=(
                 # round to 5 digits for better readability but still preserving precision
-                round(x_axis_int / 0xFFFF, 5),
-                round(y_axis_int / 0xFFFF, 5),
+                round(x_axis_int * _INV_FFFF, 5),
+                round(y_axis_int * _INV_FFFF, 5),
             )
             if color_valid
             else None,
@@ -56,6 +71,13 @@ class DPTColorXYY(DPTBase):
         cls, value: XYYColor | tuple[tuple[float, float] | None, int | None]
     ) -> DPTArray:
         """Serialize to KNX/IP raw data."""
+        return DPTArray(_XYY_STRUCT.pack(*cls._to_raw_fields(value)))
+
+    @classmethod
+    def _to_raw_fields(
+        cls, value: XYYColor | tuple[tuple[float, float] | None, int | None]
+    ) -> tuple[int, int, int, int]:
+        """Validate value and return raw x-axis, y-axis, brightness and validity flags."""
         try:
             if not isinstance(value, XYYColor):
                 value = XYYColor(*value)
@@ -64,10 +86,12 @@ class DPTColorXYY(DPTBase):
             x_axis, y_axis, brightness = 0, 0, 0
 
             if value.color is not None:
-                for _ in (axis for axis in value.color if not 0 <= axis <= 1):
+                x_color, y_color = value.color
+                if not (0 <= x_color <= 1 and 0 <= y_color <= 1):
                     raise ValueError("Color out of range")
                 color_valid = True
-                x_axis, y_axis = (round(axis * 0xFFFF) for axis in value.color)
+                x_axis = round(x_color * 0xFFFF)
+                y_axis = round(y_color * 0xFFFF)
 
             if value.brightness is not None:
                 if not 0 <= value.brightness <= 255:
@@ -75,17 +99,45 @@ class DPTColorXYY(DPTBase):
                 brightness_valid = True
                 brightness = int(value.brightness)
 
-            return DPTArray(
-                (
-                    x_axis >> 8,
-                    x_axis & 0xFF,
-                    y_axis >> 8,
-                    y_axis & 0xFF,
-                    brightness,
-                    color_valid << 1 | brightness_valid,
-                )
-            )
+            return x_axis, y_axis, brightness, color_valid << 1 | brightness_valid
         except (ValueError, TypeError) as err:
             raise ConversionError(
                 f"Could not serialize {cls.__name__}", value=value
             ) from err
+
+    @classmethod
+    def from_knx_bulk(cls, raw: bytes) -> list[XYYColor]:
+        """Parse/deserialize concatenated 6 octet payloads eg. from recorded telegrams."""
+        if len(raw) % cls.payload_length:
+            raise CouldNotParseTelegram(
+                f"Invalid bulk payload length for {cls.__name__}",
+                payload=raw,
+                expected_length=cls.payload_length,
+            )
+        return [
+            XYYColor(
+                color=(
+                    round(x_axis_int * _INV_FFFF, 5),
+                    round(y_axis_int * _INV_FFFF, 5),
+                )
+                if flags >> 1 & 0b1
+                else None,
+                brightness=brightness if flags & 0b1 else None,
+            )
+            for x_axis_int, y_axis_int, brightness, flags in _XYY_STRUCT.iter_unpack(
+                raw
+            )
+        ]
+
+    @classmethod
+    def to_knx_bulk(
+        cls,
+        values: Sequence[XYYColor | tuple[tuple[float, float] | None, int | None]],
+    ) -> bytes:
+        """Serialize multiple values to concatenated 6 octet payloads."""
+        raw = bytearray(len(values) * cls.payload_length)
+        for index, value in enumerate(values):
+            _XYY_STRUCT.pack_into(
+                raw, index * cls.payload_length, *cls._to_raw_fields(value)
+            )
+        return bytes(raw)